@@ -35,7 +35,7 @@ import { Model, ModelItem } from '@/lib/db-types';
 import { 
   calculateReserveProjections,
   generateReserveSummary,
-  calculateContributionAdequacy,
+  getContributionAdequacy,
   formatCurrency,
   formatPercentage
 } from '@/lib/reserve-calculations';
@@ -73,8 +73,8 @@ export function SimulationResults({ model, modelItems, settings }: SimulationRes
   );
 
   const adequacyPercentage = useMemo(() => 
-    calculateContributionAdequacy(adjustedModel, modelItems, settings.projectionYears),
-    [adjustedModel, modelItems, settings.projectionYears]
+    getContributionAdequacy(summary),
+    [summary]
   );
 
   // Chart data preparation - Financial model format
@@ -34,6 +34,113 @@ export interface ReserveSummary {
   maxLoanAmount: number;
 }
 
+interface YearlyExpenseBuckets {
+  totalCost: Float64Array; // Today's-dollar cost of all items, indexed by year - 1
+  largeCost: Float64Array; // Today's-dollar cost of Large items, indexed by year - 1
+  // Inflated amount to reserve for items, by the first projection year they
+  // no longer count as upcoming in; the last slot holds items past the horizon
+  reservableByYear: Float64Array;
+}
+
+/**
+ * Index (year - 1) of the projection year an item falls in, or -1 if it is
+ * not due within the projection
+ */
+function projectionYearIndex(item: ModelItem, projectionYears: number): number {
+  if (!Number.isInteger(item.year) || item.year < 1 || item.year > projectionYears) return -1;
+  return item.year - 1;
+}
+
+/**
+ * Group model items by the projection year they fall in, summing their costs
+ * in a single pass instead of re-filtering the item list every year
+ */
+function bucketExpensesByYear(
+  model: Model,
+  items: ModelItem[],
+  projectionYears: number,
+  inflationFactors: Float64Array
+): YearlyExpenseBuckets {
+  const totalCost = new Float64Array(projectionYears);
+  const largeCost = new Float64Array(projectionYears);
+  const reservableByYear = new Float64Array(projectionYears + 1);
+  const inflationBase = 1 + model.inflation_rate / 100;
+  const reservedFraction = model.loan_threshold / 100;
+
+  for (const item of items) {
+    const isLarge = item.type === 'Large';
+    const index = projectionYearIndex(item, projectionYears);
+    if (index >= 0) {
+      totalCost[index] += item.cost;
+      if (isLarge) {
+        largeCost[index] += item.cost;
+      }
+    }
+
+    const dueYear = Math.ceil(item.year);
+    if (dueYear < 1) continue;
+
+    const inflationFactor = index >= 0
+      ? inflationFactors[index]
+      : Math.pow(inflationBase, item.year - 1);
+    reservableByYear[Math.min(dueYear, projectionYears + 1) - 1] +=
+      item.cost * inflationFactor * (isLarge ? reservedFraction : 1);
+  }
+
+  return { totalCost, largeCost, reservableByYear };
+}
+
+interface ExpenseSchedule {
+  inflationFactors: Float64Array; // POWER(1+inflation%, year-1), indexed by year - 1
+  futureExpenses: Float64Array; // Inflated cost of all items due in the year
+  loanRepayments: Float64Array; // PMT on the loan taken out in the year
+  reserveContributions: Float64Array; // Reserve needed for later expenses, spread over remaining years
+}
+
+/**
+ * Build the inflated per-year expense table once per projection run
+ */
+function buildExpenseSchedule(model: Model, items: ModelItem[], projectionYears: number): ExpenseSchedule {
+  const inflationFactors = new Float64Array(projectionYears);
+  const futureExpenses = new Float64Array(projectionYears);
+  const loanRepayments = new Float64Array(projectionYears);
+  const reserveContributions = new Float64Array(projectionYears);
+  const loanPortion = 1 - model.loan_threshold / 100;
+  // Rate and term are fixed per model, so every loan shares one PMT factor
+  const loanPaymentFactor = calculatePMTFactor(model.loan_rate / 100, model.loan_years);
+
+  // Inflation power series, computed once here and indexed everywhere else
+  const inflationBase = 1 + model.inflation_rate / 100;
+  for (let index = 0; index < projectionYears; index++) {
+    inflationFactors[index] = Math.pow(inflationBase, index);
+  }
+
+  const { totalCost, largeCost, reservableByYear } =
+    bucketExpensesByYear(model, items, projectionYears, inflationFactors);
+
+  for (let index = 0; index < projectionYears; index++) {
+    futureExpenses[index] = totalCost[index] * inflationFactors[index];
+    const largeExpenses = largeCost[index] * inflationFactors[index];
+    const loanAmount = largeExpenses * loanPortion;
+    loanRepayments[index] = loanAmount > 0 ? loanAmount * loanPaymentFactor : 0;
+  }
+
+  // Reverse cumulative sum gives every year's total for later items in O(n)
+  let futureExpensesTotal = reservableByYear[projectionYears];
+  for (let index = projectionYears - 1; index >= 0; index--) {
+    const remainingYears = Math.max(projectionYears - index - 1, 1);
+    reserveContributions[index] = futureExpensesTotal / remainingYears;
+    futureExpensesTotal += reservableByYear[index];
+  }
+
+  return {
+    inflationFactors,
+    futureExpenses,
+    loanRepayments,
+    reserveContributions,
+  };
+}
+
 /**
  * Calculate reserve fund projections using financial model formulas
  */
@@ -42,54 +149,127 @@ export function calculateReserveProjections(
   items: ModelItem[],
   projectionYears: number = 30
 ): ReserveProjection[] {
-  const projections: ReserveProjection[] = [];
+  return projectReserves(model, items, projectionYears, 0);
+}
+
+interface ProjectionColumns {
+  openingBalance: Float64Array;
+  baseMaintenance: Float64Array;
+  futureExpenses: Float64Array;
+  reserveContribution: Float64Array;
+  loanRepayments: Float64Array;
+  collectionsWithoutSafetyNet: Float64Array;
+  provisionalEndBalance: Float64Array;
+  safetyNetTarget: Float64Array;
+  safetyNetTopUp: Float64Array;
+  totalMaintenanceCollected: Float64Array;
+  closingBalance: Float64Array;
+}
+
+/**
+ * Run the financial model with an optional flat amount collected on top of
+ * the regular collections every year
+ */
+function projectReserves(
+  model: Model,
+  items: ModelItem[],
+  projectionYears: number,
+  additionalContribution: number
+): ReserveProjection[] {
   const currentYear = parseInt(model.fiscal_year);
+  const expenses = buildExpenseSchedule(model, items, projectionYears);
+  const columns = runProjection(model, expenses, projectionYears, additionalContribution);
+  const projections: ReserveProjection[] = [];
+
+  // Per-item detail is only needed here, so it is not part of the schedule
+  const itemsByYear: ReserveProjection['items'][] = Array.from({ length: projectionYears }, () => []);
+  for (const item of items) {
+    const index = projectionYearIndex(item, projectionYears);
+    if (index < 0) continue;
+
+    itemsByYear[index].push({
+      id: item.id,
+      name: item.name,
+      cost: item.cost * expenses.inflationFactors[index],
+      type: item.type,
+    });
+  }
+
+  for (let index = 0; index < projectionYears; index++) {
+    projections.push({
+      year: currentYear + index,
+      openingBalance: columns.openingBalance[index],
+      baseMaintenance: columns.baseMaintenance[index],
+      futureExpenses: columns.futureExpenses[index],
+      reserveContribution: columns.reserveContribution[index],
+      loanRepayments: columns.loanRepayments[index],
+      collectionsWithoutSafetyNet: columns.collectionsWithoutSafetyNet[index],
+      provisionalEndBalance: columns.provisionalEndBalance[index],
+      safetyNetTarget: columns.safetyNetTarget[index],
+      safetyNetTopUp: columns.safetyNetTopUp[index],
+      totalMaintenanceCollected: columns.totalMaintenanceCollected[index],
+      closingBalance: columns.closingBalance[index],
+      items: itemsByYear[index],
+    });
+  }
+
+  return projections;
+}
+
+/**
+ * Year-by-year financial model over the precomputed expense schedule. Only
+ * numbers go in and out, so solvers can call it repeatedly without building
+ * per-year projection objects
+ */
+function runProjection(
+  model: Model,
+  expenses: ExpenseSchedule,
+  projectionYears: number,
+  additionalContribution: number
+): ProjectionColumns {
+  const columns: ProjectionColumns = {
+    openingBalance: new Float64Array(projectionYears),
+    baseMaintenance: new Float64Array(projectionYears),
+    futureExpenses: new Float64Array(projectionYears),
+    reserveContribution: new Float64Array(projectionYears),
+    loanRepayments: new Float64Array(projectionYears),
+    collectionsWithoutSafetyNet: new Float64Array(projectionYears),
+    provisionalEndBalance: new Float64Array(projectionYears),
+    safetyNetTarget: new Float64Array(projectionYears),
+    safetyNetTopUp: new Float64Array(projectionYears),
+    totalMaintenanceCollected: new Float64Array(projectionYears),
+    closingBalance: new Float64Array(projectionYears),
+  };
   
+  // Model percentages as fractions, converted once rather than every year
+  const safetyNetFraction = model.safety_net_percentage / 100;
   let openingBalance = model.starting_amount;
 
   for (let year = 1; year <= projectionYears; year++) {
-    const projectionYear = currentYear + year - 1;
+    const index = year - 1;
     
     // 1. Base Maintenance (inflated) = Base * POWER(1+inflation%, year-1)
-    const baseMaintenance = model.base_maintenance * Math.pow(1 + model.inflation_rate / 100, year - 1);
+    const baseMaintenance = model.base_maintenance * expenses.inflationFactors[index];
     
     // 2. Future Expenses in Year (inflated) - get expenses for this specific year
-    const yearExpenses = items.filter(item => item.year === year);
-    const futureExpenses = yearExpenses.reduce((sum, item) => {
-      return sum + (item.cost * Math.pow(1 + model.inflation_rate / 100, year - 1));
-    }, 0);
+    const futureExpenses = expenses.futureExpenses[index];
     
     // 3. Reserve Contribution calculation (simplified for now)
-    // This involves complex logic for future expenses distribution
-    const futureExpensesTotal = items
-      .filter(item => item.year > year)
-      .reduce((sum, item) => {
-        return sum + (item.cost * Math.pow(1 + model.inflation_rate / 100, item.year - 1) * 
-          (item.type === 'Large' ? model.loan_threshold / 100 : 1));
-      }, 0);
-    
-    const remainingYears = Math.max(projectionYears - year, 1);
-    const reserveContribution = futureExpensesTotal / remainingYears;
+    // Later expenses spread over the remaining years, see buildExpenseSchedule
+    const reserveContribution = expenses.reserveContributions[index];
     
     // 4. Loan Repayments (simplified - assumes loans for large expenses)
-    const largeExpenses = yearExpenses.filter(item => item.type === 'Large');
-    const loanAmount = largeExpenses.reduce((sum, item) => {
-      const inflatedCost = item.cost * Math.pow(1 + model.inflation_rate / 100, year - 1);
-      return sum + (inflatedCost * (1 - model.loan_threshold / 100));
-    }, 0);
-    
-    // PMT calculation for loan repayments (if there were loans in previous years)
-    const loanRepayments = loanAmount > 0 ? 
-      calculatePMT(model.loan_rate / 100, model.loan_years, loanAmount) : 0;
+    // PMT on this year's loan, from the precomputed schedule
+    const loanRepayments = expenses.loanRepayments[index];
     
     // 5. Collections w/o Safety Net
-    const collectionsWithoutSafetyNet = baseMaintenance + reserveContribution + loanRepayments;
+    const collectionsWithoutSafetyNet = baseMaintenance + reserveContribution + loanRepayments + additionalContribution;
     
     // 6. Provisional End Balance
     const provisionalEndBalance = openingBalance + collectionsWithoutSafetyNet - baseMaintenance - futureExpenses - loanRepayments;
     
     // 7. Safety Net Target = Safety Net % * (Base Maintenance + Future Expenses + Loan Repayments)
-    const safetyNetTarget = (model.safety_net_percentage / 100) * (baseMaintenance + futureExpenses + loanRepayments);
+    const safetyNetTarget = safetyNetFraction * (baseMaintenance + futureExpenses + loanRepayments);
     
     // 8. Safety Net Top-Up = MAX(0, Safety Net Target - Provisional End Balance)
     const safetyNetTopUp = Math.max(0, safetyNetTarget - provisionalEndBalance);
@@ -100,63 +280,60 @@ export function calculateReserveProjections(
     // 10. Closing Balance = Opening Balance + Total Maintenance Collected - Base Maintenance - Future Expenses - Loan Repayments
     const closingBalance = openingBalance + totalMaintenanceCollected - baseMaintenance - futureExpenses - loanRepayments;
     
-    projections.push({
-      year: projectionYear,
-      openingBalance,
-      baseMaintenance,
-      futureExpenses,
-      reserveContribution,
-      loanRepayments,
-      collectionsWithoutSafetyNet,
-      provisionalEndBalance,
-      safetyNetTarget,
-      safetyNetTopUp,
-      totalMaintenanceCollected,
-      closingBalance,
-      items: yearExpenses.map(item => ({
-        id: item.id,
-        name: item.name,
-        cost: item.cost * Math.pow(1 + model.inflation_rate / 100, year - 1),
-        type: item.type,
-      })),
-    });
+    columns.openingBalance[index] = openingBalance;
+    columns.baseMaintenance[index] = baseMaintenance;
+    columns.futureExpenses[index] = futureExpenses;
+    columns.reserveContribution[index] = reserveContribution;
+    columns.loanRepayments[index] = loanRepayments;
+    columns.collectionsWithoutSafetyNet[index] = collectionsWithoutSafetyNet;
+    columns.provisionalEndBalance[index] = provisionalEndBalance;
+    columns.safetyNetTarget[index] = safetyNetTarget;
+    columns.safetyNetTopUp[index] = safetyNetTopUp;
+    columns.totalMaintenanceCollected[index] = totalMaintenanceCollected;
+    columns.closingBalance[index] = closingBalance;
 
     // Set opening balance for next year
     openingBalance = closingBalance;
   }
 
-  return projections;
+  return columns;
 }
 
 /**
- * Calculate PMT (loan payment) using the standard financial formula
+ * Calculate the PMT (loan payment) per unit of principal using the standard
+ * financial formula; multiply by the principal to get the payment
  */
-function calculatePMT(rate: number, nper: number, pv: number): number {
-  if (rate === 0) return pv / nper;
-  return (pv * rate * Math.pow(1 + rate, nper)) / (Math.pow(1 + rate, nper) - 1);
+function calculatePMTFactor(rate: number, nper: number): number {
+  if (rate === 0) return 1 / nper;
+  // (1+rate)^nper - 1 via expm1/log1p stays accurate for very small rates
+  const growthMinusOne = Math.expm1(nper * Math.log1p(rate));
+  return (rate * (growthMinusOne + 1)) / growthMinusOne;
 }
 
 /**
  * Generate summary statistics from projections
  */
 export function generateReserveSummary(projections: ReserveProjection[]): ReserveSummary {
-  const totalIncome = projections.reduce((sum, p) => sum + p.totalMaintenanceCollected, 0);
-  const totalExpenses = projections.reduce((sum, p) => sum + p.baseMaintenance + p.futureExpenses, 0);
-  const finalBalance = projections[projections.length - 1]?.closingBalance ?? 0;
-  
-  // Find minimum balance and year
+  let totalIncome = 0;
+  let totalExpenses = 0;
+  let totalBalance = 0;
+  let finalBalance = 0;
   let minBalance = Number.MAX_VALUE;
   let minBalanceYear = 0;
   
-  projections.forEach(p => {
+  // Totals, final balance, minimum balance and year in a single pass
+  for (const p of projections) {
+    totalIncome += p.totalMaintenanceCollected;
+    totalExpenses += p.baseMaintenance + p.futureExpenses;
+    totalBalance += p.closingBalance;
+    finalBalance = p.closingBalance;
     if (p.closingBalance < minBalance) {
       minBalance = p.closingBalance;
       minBalanceYear = p.year;
     }
-  });
+  }
 
-  // Calculate average balance
-  const averageBalance = projections.reduce((sum, p) => sum + p.closingBalance, 0) / projections.length;
+  const averageBalance = totalBalance / projections.length;
 
   // Check if loan is needed (any negative balance)
   const needsLoan = minBalance < 0;
@@ -174,6 +351,10 @@ export function generateReserveSummary(projections: ReserveProjection[]): Reserv
   };
 }
 
+// Solver settings for calculateRequiredContribution (dollars per year)
+const CONTRIBUTION_TOLERANCE = 0.01;
+const MAX_SOLVER_ITERATIONS = 20;
+
 /**
  * Calculate required contribution to maintain positive balance
  */
@@ -183,17 +364,71 @@ export function calculateRequiredContribution(
   targetMinBalance: number = 0,
   projectionYears: number = 30
 ): number {
-  // Simplified implementation - would need more complex logic for full financial model
-  const projections = calculateReserveProjections(model, items, projectionYears);
-  const summary = generateReserveSummary(projections);
+  // Work on the numeric columns only; no per-year projection objects needed
+  const expenses = buildExpenseSchedule(model, items, projectionYears);
+  const baseColumns = runProjection(model, expenses, projectionYears, 0);
   
-  if (summary.minBalance >= targetMinBalance) {
+  if (minimumOf(baseColumns.closingBalance) >= targetMinBalance) {
     return model.base_maintenance;
   }
   
-  // Calculate additional contribution needed
-  const deficit = targetMinBalance - summary.minBalance;
-  return model.base_maintenance + (deficit / projectionYears);
+  // A flat extra collection raises each provisional end balance along a
+  // convex piecewise-linear curve (the safety net target does not depend on
+  // it), so Newton's method reaches the required amount in a few runs
+  let columns = baseColumns;
+  let additionalContribution = 0;
+  for (let iteration = 0; iteration < MAX_SOLVER_ITERATIONS; iteration++) {
+    const next = newtonContributionStep(columns, additionalContribution, targetMinBalance);
+    // Without safety net top-ups every balance is linear above this point,
+    // so a step upwards lands on the answer and needs no checking run
+    const converged = Math.abs(next - additionalContribution) < CONTRIBUTION_TOLERANCE ||
+      (next >= additionalContribution && columns.safetyNetTopUp.every(topUp => topUp === 0));
+    additionalContribution = next;
+    if (converged) break;
+
+    columns = runProjection(model, expenses, projectionYears, additionalContribution);
+  }
+
+  return model.base_maintenance + additionalContribution;
+}
+
+/**
+ * One Newton step on the extra annual contribution, taking the largest
+ * tangent root over years not held up by their safety net target
+ */
+function newtonContributionStep(
+  columns: ProjectionColumns,
+  additionalContribution: number,
+  targetMinBalance: number
+): number {
+  let required = 0;
+  let slope = 0;
+
+  for (let index = 0; index < columns.closingBalance.length; index++) {
+    slope += 1;
+    if (columns.safetyNetTarget[index] < targetMinBalance) {
+      required = Math.max(
+        required,
+        additionalContribution + (targetMinBalance - columns.provisionalEndBalance[index]) / slope
+      );
+    }
+
+    // A top-up pins the closing balance, so later years restart the count
+    if (columns.safetyNetTopUp[index] > 0) slope = 0;
+  }
+
+  return required;
+}
+
+/**
+ * Smallest value in a projection column
+ */
+function minimumOf(values: Float64Array): number {
+  let minimum = Number.MAX_VALUE;
+  for (let index = 0; index < values.length; index++) {
+    if (values[index] < minimum) minimum = values[index];
+  }
+  return minimum;
 }
 
 /**
@@ -205,8 +440,13 @@ export function calculateContributionAdequacy(
   projectionYears: number = 30
 ): number {
   const projections = calculateReserveProjections(model, items, projectionYears);
-  const summary = generateReserveSummary(projections);
-  
+  return getContributionAdequacy(generateReserveSummary(projections));
+}
+
+/**
+ * Calculate contribution adequacy percentage from an existing summary
+ */
+export function getContributionAdequacy(summary: ReserveSummary): number {
   if (summary.minBalance >= 0) {
     return 100; // Fully adequate
   }